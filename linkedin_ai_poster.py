@@ -12,13 +12,28 @@ Flow:
 Author: Jasmeet Singh
 """
 
+import copy
 import os
 import json
-import requests
-import xml.etree.ElementTree as ET
+import string
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+from io import BytesIO
 from urllib.parse import quote
 
+# requests and the XML parsers are imported lazily inside the functions
+# that need them - they cost ~100ms at startup, which matters for
+# short-lived cron/CI invocations that may exit early on validation.
+
+# orjson encodes/decodes JSON 2-10x faster; fall back to stdlib if missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # ============== CONFIGURATION ==============
 
@@ -41,8 +56,61 @@ SEARCH_QUERIES = [
     "Mobile app development trends"
 ]
 
-# Post History (to avoid repetition)
-POST_HISTORY_FILE = "post_history.json"
+# Only the first 3 queries are searched; their feed URLs never change,
+# so build them once at import
+RSS_URLS = [
+    (query, f"https://news.google.com/rss/search?q={quote(query)}&hl=en-US&gl=US&ceid=US:en")
+    for query in SEARCH_QUERIES[:3]
+]
+
+# Post History (append-only JSONL log, to avoid repetition)
+POST_HISTORY_FILE = "post_history.jsonl"
+
+# RSS cache (conditional GET - skip re-downloading unchanged feeds)
+RSS_CACHE_FILE = "rss_cache.json"
+
+# Timeouts - every HTTP call is bounded, and the whole run is capped so
+# a network hang can't wedge the cron job indefinitely
+RSS_TIMEOUT = (3, 7)  # (connect, read) seconds per feed
+API_TIMEOUT = 30  # seconds for Groq/LinkedIn calls
+PIPELINE_TIMEOUT = 120  # seconds for the whole run
+
+# Shared HTTP session, created on first use (see get_session)
+_session = None
+
+
+def get_session():
+    """Return the shared HTTP session, creating it on first use.
+
+    The session reuses keep-alive connections (skips repeat TLS
+    handshakes to Groq/LinkedIn) and retries transient errors with
+    exponential backoff + jitter, capped at 30s per wait. urllib3
+    honors Retry-After on 429/503 before applying its own backoff, so
+    a rate limit doesn't abort the run and waste upstream RSS/LLM work.
+    Lazy so importing this module doesn't pay the requests import cost.
+    """
+    global _session
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        _session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=1,
+                backoff_jitter=1,
+                backoff_max=30,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["GET", "POST"],
+            ),
+        )
+        _session.mount("https://", adapter)
+        _session.mount("http://", adapter)
+    return _session
 
 
 # ============== MASTER PROMPT ==============
@@ -84,13 +152,13 @@ Write authentic, engaging LinkedIn posts that feel human-written, not AI-generat
 #AndroidDev #Kotlin #JetpackCompose #MobileDevelopment #AppDevelopment #SoftwareEngineering #TechCommunity #Programming #BuildInPublic #HealthTech"""
 
 
-TOPIC_PICKER_PROMPT = """Based on these trending topics/news in Android development, pick the BEST ONE for a LinkedIn post.
+TOPIC_AND_POST_PROMPT = """Based on these trending topics/news in Android development, pick the BEST ONE for a LinkedIn post, then write that post.
 
 ## TRENDING TOPICS:
-{topics}
+$topics
 
 ## ALREADY POSTED (DO NOT SELECT THESE):
-{posted_topics}
+$posted_topics
 
 ## SELECTION CRITERIA:
 1. Currently relevant/hot in the community
@@ -99,22 +167,32 @@ TOPIC_PICKER_PROMPT = """Based on these trending topics/news in Android developm
 4. Will spark engagement (comments, discussions)
 5. Not too generic or overdone
 
+## POST REQUIREMENTS:
+1. Start with a scroll-stopping hook (first line is CRUCIAL)
+2. Add Jasmeet's perspective as an Android dev working on healthcare apps
+3. Include specific technical details or real scenarios where relevant
+4. Keep it 150-250 words
+5. End with an engaging question
+6. Add 3-5 hashtags at the very end
+7. Write like a real developer sharing genuine thoughts, not AI or a motivational speaker
+
 ## RESPOND IN THIS EXACT JSON FORMAT:
-{{
+{
     "selected_topic": "The topic you picked",
     "why_selected": "Brief reason why this is best",
-    "post_angle": "Suggested angle/perspective for the post",
-    "post_type": "technical_tip | career_insight | trend_analysis | personal_story | hot_take"
-}}
+    "post_angle": "The angle/perspective the post takes",
+    "post_type": "technical_tip | career_insight | trend_analysis | personal_story | hot_take",
+    "post_content": "The full LinkedIn post, with \\n for line breaks"
+}
 
 Return ONLY the JSON, nothing else."""
 
 
 POST_GENERATOR_PROMPT = """Write a LinkedIn post for Jasmeet Singh.
 
-## TOPIC: {topic}
-## ANGLE: {angle}
-## POST TYPE: {post_type}
+## TOPIC: $topic
+## ANGLE: $angle
+## POST TYPE: $post_type
 
 ## REQUIREMENTS:
 1. Start with a scroll-stopping hook (first line is CRUCIAL)
@@ -133,27 +211,74 @@ POST_GENERATOR_PROMPT = """Write a LinkedIn post for Jasmeet Singh.
 Write the post now (just the post content, nothing else):"""
 
 
+# Compiled once at import so each run only substitutes the variable slots
+_TOPIC_AND_POST_TEMPLATE = string.Template(TOPIC_AND_POST_PROMPT)
+_POST_GENERATOR_TEMPLATE = string.Template(POST_GENERATOR_PROMPT)
+
+# Static skeleton of the LinkedIn post payload; author and text are
+# filled in per call
+_POST_TEMPLATE = {
+    "author": None,
+    "lifecycleState": "PUBLISHED",
+    "specificContent": {
+        "com.linkedin.ugc.ShareContent": {
+            "shareCommentary": {
+                "text": None
+            },
+            "shareMediaCategory": "NONE"
+        }
+    },
+    "visibility": {
+        "com.linkedin.ugc.MemberNetworkVisibility": "PUBLIC"
+    }
+}
+
+
 # ============== HELPER FUNCTIONS ==============
 
+def json_loads(data):
+    """Parse JSON from str or bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(data: dict, indent: bool = True) -> bytes:
+    """Serialize to JSON bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None).encode("utf-8")
+
+
 def load_json_file(filepath: str) -> dict:
     """Load JSON file if exists"""
     if os.path.exists(filepath):
-        with open(filepath, "r") as f:
-            return json.load(f)
+        with open(filepath, "rb") as f:
+            return json_loads(f.read())
     return {}
 
 
 def save_json_file(filepath: str, data: dict):
-    """Save data to JSON file"""
-    with open(filepath, "w") as f:
-        json.dump(data, f, indent=2)
+    """Save data to JSON file (atomic, so a crash can't corrupt it)"""
+    tmp_path = filepath + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(json_dumps(data))
+    os.replace(tmp_path, filepath)
+
+
+def load_post_history(limit: int = 50) -> list:
+    """Load the most recent posts from the JSONL history log"""
+    if not os.path.exists(POST_HISTORY_FILE):
+        return []
+    with open(POST_HISTORY_FILE, "rb") as f:
+        recent = deque(f, maxlen=limit)
+    return [json_loads(line) for line in recent if line.strip()]
 
 
 def get_posted_topics() -> list:
     """Get list of previously posted topics to avoid duplicates"""
-    history = load_json_file(POST_HISTORY_FILE)
     posted = []
-    for post in history.get("posts", []):
+    for post in load_post_history():
         topic = post.get("topic", "")
         if topic:
             posted.append(topic)
@@ -167,8 +292,13 @@ def is_similar_topic(title: str, posted_topics: list) -> bool:
     
     for posted in posted_topics:
         posted_lower = posted.lower()
+
+        # Containment either way is a sure duplicate
+        if title_lower in posted_lower or posted_lower in title_lower:
+            return True
+
         posted_words = set(posted_lower.split())
-        
+
         # Check word overlap
         common_words = title_words.intersection(posted_words)
         # Remove common stop words from count
@@ -210,65 +340,137 @@ def filter_duplicate_topics(topics: list, posted_topics: list) -> list:
     return filtered
 
 
+def _fetch_query(rss_url: str, cached: dict) -> dict:
+    """Fetch and parse one Google News RSS feed.
+
+    Sends a conditional GET using the ETag/Last-Modified from the
+    previous run; on 304 Not Modified the cached items are reused
+    without downloading the feed body. Returns the new cache entry.
+    """
+    headers = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+    }
+    if cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
+
+    response = get_session().get(rss_url, headers=headers, timeout=RSS_TIMEOUT)
+
+    if response.status_code == 304:
+        # Feed unchanged since last run
+        return cached
+
+    if response.status_code == 200:
+        return {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "items": _parse_rss_items(response.content)
+        }
+
+    # Unexpected status - keep the old entry so the next run can retry
+    return cached
+
+
+def _parse_rss_items(content: bytes) -> list:
+    """Parse the first 3 <item> entries from an RSS feed body"""
+    # lxml parses RSS with a streaming C parser; fall back to stdlib if
+    # missing. Imported here so startup doesn't pay for the XML stack.
+    try:
+        from lxml import etree as lxml_etree
+    except ImportError:
+        lxml_etree = None
+
+    results = []
+
+    if lxml_etree is not None:
+        # Streaming parse - stop after 3 items instead of building
+        # a tree for the whole feed
+        for item_count, (_, item) in enumerate(lxml_etree.iterparse(BytesIO(content), tag="item")):
+            if item_count == 3:
+                break
+            title = item.findtext("title") or ""
+            if title:
+                results.append({
+                    "title": title,
+                    "body": (item.findtext("description") or "")[:200],
+                    "source": item.findtext("source") or "Google News",
+                    "date": item.findtext("pubDate") or "recent"
+                })
+            item.clear()
+        return results
+
+    # Fallback: stdlib ElementTree
+    import xml.etree.ElementTree as ET
+
+    root = ET.fromstring(content)
+    channel = root.find("channel")
+    if channel is None:
+        return results
+
+    # <item> elements are direct children of <channel> in Google News
+    # RSS - iterate them directly instead of a descendant search, and
+    # stop after the first 3 without materializing the rest
+    for item in islice(channel.iterfind("item"), 3):
+        title = item.find("title")
+        description = item.find("description")
+        pub_date = item.find("pubDate")
+        source = item.find("source")
+
+        if title is not None:
+            results.append({
+                "title": title.text or "",
+                "body": (description.text or "")[:200] if description is not None else "",
+                "source": source.text if source is not None else "Google News",
+                "date": pub_date.text if pub_date is not None else "recent"
+            })
+
+    return results
+
+
 def search_trending_topics() -> list:
     """Search Google News RSS for trending Android topics"""
     print("\n🔍 Searching for trending Android topics...")
     print("=" * 50)
 
     all_results = []
-
-    for query in SEARCH_QUERIES[:3]:
-        try:
-            # Google News RSS feed
-            encoded_query = quote(query)
-            rss_url = f"https://news.google.com/rss/search?q={encoded_query}&hl=en-US&gl=US&ceid=US:en"
-
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            }
-
-            response = requests.get(rss_url, headers=headers, timeout=10)
-
-            if response.status_code == 200:
-                # Parse XML
-                root = ET.fromstring(response.content)
-
-                # Find all items in the RSS feed
-                for item in root.findall(".//item")[:3]:
-                    title = item.find("title")
-                    description = item.find("description")
-                    pub_date = item.find("pubDate")
-                    source = item.find("source")
-
-                    if title is not None:
-                        all_results.append({
-                            "title": title.text or "",
-                            "body": (description.text or "")[:200] if description is not None else "",
-                            "source": source.text if source is not None else "Google News",
-                            "date": pub_date.text if pub_date is not None else "recent"
-                        })
-
-        except Exception as e:
-            print(f"   ⚠️ Search error for '{query}': {e}")
-            continue
-
-    # Remove duplicates
-    seen_titles = set()
-    unique_results = []
+    cache = load_json_file(RSS_CACHE_FILE)
+
+    # Fetch all feeds in parallel - pure network I/O, so total time
+    # is the slowest fetch instead of the sum of all three
+    get_session()  # create the session before worker threads race to it
+    with ThreadPoolExecutor(max_workers=len(RSS_URLS)) as executor:
+        futures = {
+            executor.submit(_fetch_query, rss_url, cache.get(query, {})): query
+            for query, rss_url in RSS_URLS
+        }
+        for future in as_completed(futures):
+            try:
+                entry = future.result()
+                cache[futures[future]] = entry
+                all_results.extend(entry.get("items", []))
+            except Exception as e:
+                print(f"   ⚠️ Search error for '{futures[future]}': {e}")
+
+    save_json_file(RSS_CACHE_FILE, cache)
+
+    # Remove duplicates - a dict keyed by lowercased title keeps the
+    # first occurrence in insertion order, in a single pass
+    seen = {}
     for r in all_results:
-        title_lower = r["title"].lower()
-        if title_lower not in seen_titles and r["title"]:
-            seen_titles.add(title_lower)
-            unique_results.append(r)
+        key = r["title"].lower()
+        if key and key not in seen:
+            seen[key] = r
             print(f"   📰 {r['title'][:60]}...")
+    unique_results = list(seen.values())
 
     # If no results from Google News, use fallback topics
     if not unique_results:
         print("   ⚠️ Using fallback trending topics...")
         unique_results = get_fallback_topics()
 
-    # Filter out already posted topics
-    posted_topics = get_posted_topics()
+    # Filter out recently posted topics (older ones are fair game again)
+    posted_topics = get_posted_topics()[-20:]
     if posted_topics:
         print(f"\n📚 Found {len(posted_topics)} previously posted topics")
         unique_results = filter_duplicate_topics(unique_results, posted_topics)
@@ -313,7 +515,8 @@ def get_fallback_topics() -> list:
     ]
 
 
-def call_groq_api(messages: list, temperature: float = 0.7) -> str:
+def call_groq_api(messages: list, temperature: float = 0.7, max_tokens: int = 1024,
+                  stream: bool = False) -> str:
     """Call Groq API for LLM completion"""
     headers = {
         "Content-Type": "application/json",
@@ -324,20 +527,60 @@ def call_groq_api(messages: list, temperature: float = 0.7) -> str:
         "model": GROQ_MODEL,
         "messages": messages,
         "temperature": temperature,
-        "max_tokens": 1024
+        "max_tokens": max_tokens
     }
 
-    response = requests.post(GROQ_API_URL, headers=headers, json=payload)
+    if stream:
+        # Consume the response as SSE frames as they are generated
+        payload["stream"] = True
+        response = get_session().post(GROQ_API_URL, headers=headers, json=payload,
+                                      stream=True, timeout=API_TIMEOUT)
+
+        if response.status_code != 200:
+            raise Exception(f"Groq API error: {response.status_code} - {response.text}")
+
+        chunks = []
+        for line in response.iter_lines():
+            if not line.startswith(b"data: "):
+                continue
+            data = line[len(b"data: "):]
+            if data == b"[DONE]":
+                break
+            delta = json_loads(data)["choices"][0].get("delta", {})
+            if delta.get("content"):
+                chunks.append(delta["content"])
+        return "".join(chunks)
+
+    response = get_session().post(GROQ_API_URL, headers=headers, json=payload,
+                                  timeout=API_TIMEOUT)
 
     if response.status_code == 200:
-        return response.json()["choices"][0]["message"]["content"]
+        return json_loads(response.content)["choices"][0]["message"]["content"]
     else:
         raise Exception(f"Groq API error: {response.status_code} - {response.text}")
 
 
-def pick_best_topic(topics: list) -> dict:
-    """Use LLM to pick the best topic from search results"""
-    print("\n🤖 AI is analyzing topics...")
+def _strip_code_fences(text: str) -> str:
+    """Strip markdown code fences the model sometimes wraps JSON in"""
+    text = text.strip()
+    if text.startswith("```json"):
+        text = text[7:]
+    if text.startswith("```"):
+        text = text[3:]
+    if text.endswith("```"):
+        text = text[:-3]
+    return text.strip()
+
+
+def select_and_generate_post(topics: list) -> dict:
+    """Pick the best topic and write the post in a single LLM call.
+
+    One round-trip instead of pick_best_topic + generate_post - the LLM
+    calls dominate wall time, so merging them roughly halves it (and
+    sends the system prompt once). Falls back to picking the first
+    topic and generating separately if the combined JSON doesn't parse.
+    """
+    print("\n🤖 AI is picking a topic and writing the post...")
     print("=" * 50)
 
     # Format topics for prompt
@@ -349,39 +592,46 @@ def pick_best_topic(topics: list) -> dict:
     posted_topics = get_posted_topics()
     posted_text = "\n".join([f"- {t}" for t in posted_topics[-10:]]) if posted_topics else "None yet"
 
-    prompt = TOPIC_PICKER_PROMPT.format(topics=topics_text, posted_topics=posted_text)
+    prompt = _TOPIC_AND_POST_TEMPLATE.substitute(topics=topics_text, posted_topics=posted_text)
 
     messages = [
         {"role": "system", "content": SYSTEM_PROMPT},
         {"role": "user", "content": prompt}
     ]
 
-    response = call_groq_api(messages, temperature=0.5)
+    response = call_groq_api(messages, temperature=0.7, max_tokens=1200)
 
     # Parse JSON response
     try:
-        # Clean response if needed
-        response = response.strip()
-        if response.startswith("```json"):
-            response = response[7:]
-        if response.startswith("```"):
-            response = response[3:]
-        if response.endswith("```"):
-            response = response[:-3]
-
-        result = json.loads(response.strip())
-        print(f"   ✅ Selected: {result['selected_topic'][:50]}...")
-        print(f"   📝 Angle: {result['post_angle']}")
-        return result
-    except json.JSONDecodeError:
-        # Fallback if JSON parsing fails
+        result = json_loads(_strip_code_fences(response))
+        post_content = result["post_content"].strip()
+    except (json.JSONDecodeError, KeyError, AttributeError):
+        # Fallback if the combined response doesn't parse: take the
+        # first topic and generate the post with a dedicated call
         print("   ⚠️ JSON parse failed, using first topic")
-        return {
+        result = {
             "selected_topic": topics[0]["title"],
             "why_selected": "First trending topic",
             "post_angle": "Share thoughts on this trend",
             "post_type": "trend_analysis"
         }
+        result["post_content"] = generate_post(result)
+        return result
+
+    print(f"   ✅ Selected: {result['selected_topic'][:50]}...")
+    print(f"   📝 Angle: {result['post_angle']}")
+
+    # Clean up the post
+    if post_content.startswith('"') and post_content.endswith('"'):
+        post_content = post_content[1:-1]
+    result["post_content"] = post_content
+
+    print(f"\n📝 Generated Post Preview:")
+    print("-" * 40)
+    print(post_content[:300] + "..." if len(post_content) > 300 else post_content)
+    print("-" * 40)
+
+    return result
 
 
 def generate_post(topic_data: dict) -> str:
@@ -389,7 +639,7 @@ def generate_post(topic_data: dict) -> str:
     print("\n✍️ Generating LinkedIn post...")
     print("=" * 50)
 
-    prompt = POST_GENERATOR_PROMPT.format(
+    prompt = _POST_GENERATOR_TEMPLATE.substitute(
         topic=topic_data["selected_topic"],
         angle=topic_data["post_angle"],
         post_type=topic_data["post_type"]
@@ -400,7 +650,7 @@ def generate_post(topic_data: dict) -> str:
         {"role": "user", "content": prompt}
     ]
 
-    post_content = call_groq_api(messages, temperature=0.8)
+    post_content = call_groq_api(messages, temperature=0.8, stream=True)
 
     # Clean up the post
     post_content = post_content.strip()
@@ -415,8 +665,14 @@ def generate_post(topic_data: dict) -> str:
     return post_content
 
 
+@lru_cache(maxsize=1)
 def load_linkedin_tokens() -> dict:
-    """Load LinkedIn tokens from file or environment variables"""
+    """Load LinkedIn tokens from file or environment variables.
+
+    Cached for the lifetime of the run - main() validates tokens and
+    post_to_linkedin() loads them again, so the second call skips the
+    env/file lookup. Tests can reset via load_linkedin_tokens.cache_clear().
+    """
     # First check environment variables (for GitHub Actions)
     access_token = os.getenv("LINKEDIN_ACCESS_TOKEN")
     person_urn = os.getenv("LINKEDIN_PERSON_URN")
@@ -431,7 +687,33 @@ def load_linkedin_tokens() -> dict:
     return load_json_file(LINKEDIN_TOKEN_FILE)
 
 
-def post_to_linkedin(post_content: str) -> dict:
+def _fetch_urn(access_token: str) -> str | None:
+    """Fetch the member URN from LinkedIn user info.
+
+    On success the URN is also cached into linkedin_tokens.json so
+    future runs skip this lookup entirely.
+    """
+    url = "https://api.linkedin.com/v2/userinfo"
+    headers = {"Authorization": f"Bearer {access_token}"}
+    response = get_session().get(url, headers=headers, timeout=API_TIMEOUT)
+
+    if response.status_code != 200:
+        print(f"❌ Failed to get user info: {response.text}")
+        return None
+
+    user_info = json_loads(response.content)
+    person_urn = f"urn:li:person:{user_info['sub']}"
+
+    file_tokens = load_json_file(LINKEDIN_TOKEN_FILE)
+    if file_tokens.get("access_token") == access_token and not file_tokens.get("person_urn"):
+        file_tokens["person_urn"] = person_urn
+        save_json_file(LINKEDIN_TOKEN_FILE, file_tokens)
+        load_linkedin_tokens.cache_clear()
+
+    return person_urn
+
+
+def post_to_linkedin(post_content: str, person_urn: str = None) -> dict:
     """Post content to LinkedIn"""
     print("\n📤 Posting to LinkedIn...")
     print("=" * 50)
@@ -444,20 +726,13 @@ def post_to_linkedin(post_content: str) -> dict:
         return {"success": False, "error": "No tokens"}
 
     access_token = tokens["access_token"]
-    person_urn = tokens.get("person_urn")
+    person_urn = person_urn or tokens.get("person_urn")
 
     if not person_urn:
         # Fetch user info to get URN
         print("   Fetching user info...")
-        url = "https://api.linkedin.com/v2/userinfo"
-        headers = {"Authorization": f"Bearer {access_token}"}
-        response = requests.get(url, headers=headers)
-
-        if response.status_code == 200:
-            user_info = response.json()
-            person_urn = f"urn:li:person:{user_info['sub']}"
-        else:
-            print(f"❌ Failed to get user info: {response.text}")
+        person_urn = _fetch_urn(access_token)
+        if not person_urn:
             return {"success": False, "error": "Failed to get user URN"}
 
     # Create post
@@ -470,23 +745,12 @@ def post_to_linkedin(post_content: str) -> dict:
         "LinkedIn-Version": "202401",
     }
 
-    post_data = {
-        "author": person_urn,
-        "lifecycleState": "PUBLISHED",
-        "specificContent": {
-            "com.linkedin.ugc.ShareContent": {
-                "shareCommentary": {
-                    "text": post_content
-                },
-                "shareMediaCategory": "NONE"
-            }
-        },
-        "visibility": {
-            "com.linkedin.ugc.MemberNetworkVisibility": "PUBLIC"
-        }
-    }
+    post_data = copy.deepcopy(_POST_TEMPLATE)
+    post_data["author"] = person_urn
+    post_data["specificContent"]["com.linkedin.ugc.ShareContent"]["shareCommentary"]["text"] = post_content
 
-    response = requests.post(url, headers=headers, json=post_data)
+    response = get_session().post(url, headers=headers, json=post_data,
+                                  timeout=API_TIMEOUT)
 
     if response.status_code == 201:
         post_id = response.headers.get("x-restli-id", "Unknown")
@@ -500,23 +764,21 @@ def post_to_linkedin(post_content: str) -> dict:
 
 
 def save_to_history(topic: str, post_content: str, post_id: str):
-    """Save posted content to history"""
-    history = load_json_file(POST_HISTORY_FILE)
-
-    if "posts" not in history:
-        history["posts"] = []
+    """Append posted content to the history log.
 
-    history["posts"].append({
+    One JSON line per post - an O(1) append instead of rewriting the
+    whole file, and a crash mid-write can't corrupt earlier entries.
+    Readers only look at the last 50 lines (see load_post_history).
+    """
+    entry = {
         "date": datetime.now().isoformat(),
         "topic": topic,
         "post_preview": post_content[:100] + "...",
         "post_id": post_id
-    })
-
-    # Keep last 50 posts only
-    history["posts"] = history["posts"][-50:]
+    }
 
-    save_json_file(POST_HISTORY_FILE, history)
+    with open(POST_HISTORY_FILE, "ab") as f:
+        f.write(json_dumps(entry, indent=False) + b"\n")
     print(f"   📚 Saved to history")
 
 
@@ -542,6 +804,14 @@ def main(dry_run: bool = False):
         print("   Or run linkedin_post.py first to authenticate and create linkedin_tokens.json")
         return
 
+    # The URN doesn't depend on the generated content - kick off the
+    # lookup in the background so it overlaps the RSS + LLM work
+    urn_future = None
+    if not dry_run and not tokens.get("person_urn"):
+        urn_future = ThreadPoolExecutor(max_workers=1).submit(
+            _fetch_urn, tokens["access_token"]
+        )
+
     try:
         # Step 1: Search trending topics (with duplicate filtering)
         topics = search_trending_topics()
@@ -550,11 +820,9 @@ def main(dry_run: bool = False):
             print("❌ No topics found. Exiting.")
             return
 
-        # Step 2: Pick best topic using AI
-        topic_data = pick_best_topic(topics)
-
-        # Step 3: Generate post using AI
-        post_content = generate_post(topic_data)
+        # Step 2+3: Pick best topic and generate post in one AI call
+        topic_data = select_and_generate_post(topics)
+        post_content = topic_data["post_content"]
 
         # Step 4: Post to LinkedIn (or dry run)
         if dry_run:
@@ -565,7 +833,15 @@ def main(dry_run: bool = False):
             print(post_content)
             print("=" * 60)
         else:
-            result = post_to_linkedin(post_content)
+            person_urn = None
+            if urn_future is not None:
+                try:
+                    person_urn = urn_future.result(timeout=API_TIMEOUT)
+                except Exception as e:
+                    # post_to_linkedin retries the lookup itself
+                    print(f"   ⚠️ URN prefetch failed: {e}")
+
+            result = post_to_linkedin(post_content, person_urn=person_urn)
 
             if result["success"]:
                 save_to_history(
@@ -586,6 +862,7 @@ def main(dry_run: bool = False):
 
 
 if __name__ == "__main__":
+    import signal
     import sys
 
     # Check for dry-run flag
@@ -594,4 +871,13 @@ if __name__ == "__main__":
     if dry_run:
         print("🧪 Running in DRY RUN mode (won't post to LinkedIn)")
 
+    def _on_timeout(signum, frame):
+        print(f"\n❌ Pipeline timed out after {PIPELINE_TIMEOUT}s")
+        sys.exit(1)
+
+    # Global safety net on top of the per-request timeouts
+    if hasattr(signal, "SIGALRM"):  # not available on Windows
+        signal.signal(signal.SIGALRM, _on_timeout)
+        signal.alarm(PIPELINE_TIMEOUT)
+
     main(dry_run=dry_run)